@@ -23,7 +23,34 @@ Example:
     >>> layout.kv("Environment", "production")
 """
 
-from pintui import format, layout, messages, progress
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+from pintui import _ansi, format, layout, messages
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from pintui import progress
+
+# Set up the console once for every submodule
+_ansi.init()
 
 __version__ = "0.1.0"
 __all__ = ["messages", "layout", "progress", "format"]
+
+# Submodules imported on first access, keeping their setup (such as the
+# spinner thread machinery) out of `import pintui`
+_LAZY_SUBMODULES = frozenset({"progress"})
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_SUBMODULES)
@@ -0,0 +1,82 @@
+"""
+ANSI escape codes and console setup for terminal colors.
+
+Windows consoles may need colorama to translate escape codes, so it is used
+there. Everywhere else ANSI is native: the codes are plain constants and
+stdout is left unwrapped, avoiding colorama's per-write proxy.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import TextIO
+
+
+def is_tty(stream: TextIO | None) -> bool:
+    """Report whether a stream is an open terminal.
+
+    Safe for a missing stream (sys.stdout is None under pythonw and some
+    services) and for a closed one.
+    """
+    try:
+        return stream is not None and stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+# PINTUI_FORCE_COLOR=1 forces color on, PINTUI_FORCE_COLOR=0 forces it off.
+FORCE_COLOR = os.environ.get("PINTUI_FORCE_COLOR")
+
+
+def _color_enabled() -> bool:
+    """Decide once, at import, whether output is colored.
+
+    Checked in order: PINTUI_FORCE_COLOR, CLICOLOR_FORCE (non-zero forces
+    color on), NO_COLOR (any non-empty value turns it off), CLICOLOR=0 (off),
+    and finally whether stdout is a terminal.
+    """
+    if FORCE_COLOR:
+        return FORCE_COLOR != "0"
+    clicolor_force = os.environ.get("CLICOLOR_FORCE")
+    if clicolor_force and clicolor_force != "0":
+        return True
+    if os.environ.get("NO_COLOR") or os.environ.get("CLICOLOR") == "0":
+        return False
+    return is_tty(sys.stdout)
+
+
+COLOR = _color_enabled()
+
+if sys.platform == "win32":
+    import colorama
+    from colorama import Fore, Style
+else:
+
+    class Fore:
+        """Foreground color codes (subset of colorama.Fore)."""
+
+        BLUE = "\x1b[34m"
+        CYAN = "\x1b[36m"
+        GREEN = "\x1b[32m"
+        RED = "\x1b[31m"
+        YELLOW = "\x1b[33m"
+
+    class Style:
+        """Text style codes (subset of colorama.Style)."""
+
+        DIM = "\x1b[2m"
+        RESET_ALL = "\x1b[0m"
+
+
+def init() -> None:
+    """Set up stdout for colored output; called once by the package.
+
+    Only Windows needs colorama's stdout wrapper, installed when color is on
+    so that it translates codes but never strips them.
+    """
+    if sys.platform == "win32" and COLOR:
+        colorama.init(strip=False)
+
+
+__all__ = ["COLOR", "FORCE_COLOR", "Fore", "Style", "init", "is_tty"]
@@ -0,0 +1,112 @@
+"""
+Numba-compiled kernels for bulk formatting helpers.
+
+Imported lazily by pintui.format; requires the optional numba dependency.
+"""
+
+import numpy as np
+from numba import njit
+
+# Sentinels written in place of a parsed size
+BLANK = -2  # whitespace-only line, dropped from the result
+FALLBACK = -1  # line the kernel cannot handle exactly; parse it in Python
+
+# Exact float powers of ten for the fractional digits the kernel accepts
+_POW10 = np.array([10.0**k for k in range(16)])
+
+# Integer mantissas stay below 10**15 < 2**53, so dividing by a power of ten
+# is a single correctly rounded operation, matching float() on the string.
+_MAX_DIGITS = 15
+
+# Largest float that still converts to int64 without overflow
+_INT64_LIMIT = 9.2e18
+
+
+@njit(cache=True)
+def _is_space(c: int) -> bool:
+    # Same set as bytes.strip(): space, \t, \n, \v, \f, \r
+    return c == 32 or 9 <= c <= 13
+
+
+@njit(cache=True)
+def _parse_line(buf: np.ndarray, start: int, end: int) -> int:
+    while start < end and _is_space(buf[start]):
+        start += 1
+    while end > start and _is_space(buf[end - 1]):
+        end -= 1
+    if start == end:
+        return BLANK
+
+    # Optional "B", optionally preceded by K/M/G/T (either case)
+    multiplier = 1
+    if buf[end - 1] == 66 or buf[end - 1] == 98:
+        end -= 1
+        if end > start:
+            c = buf[end - 1] | 0x20
+            if c == 107:
+                multiplier = 1 << 10
+            elif c == 109:
+                multiplier = 1 << 20
+            elif c == 103:
+                multiplier = 1 << 30
+            elif c == 116:
+                multiplier = 1 << 40
+            if multiplier != 1:
+                end -= 1
+    while end > start and _is_space(buf[end - 1]):
+        end -= 1
+
+    # Plain decimal: digits, optionally followed by "." and more digits
+    mantissa = 0
+    digits = 0
+    frac_digits = 0
+    i = start
+    while i < end and 48 <= buf[i] <= 57:
+        mantissa = mantissa * 10 + (buf[i] - 48)
+        digits += 1
+        i += 1
+        if digits > _MAX_DIGITS:
+            return FALLBACK
+    if digits == 0:
+        return FALLBACK
+    if i < end and buf[i] == 46:
+        i += 1
+        while i < end and 48 <= buf[i] <= 57:
+            mantissa = mantissa * 10 + (buf[i] - 48)
+            digits += 1
+            frac_digits += 1
+            i += 1
+            if digits > _MAX_DIGITS:
+                return FALLBACK
+        if frac_digits == 0:
+            return FALLBACK
+    if i != end:
+        return FALLBACK
+
+    value = mantissa / _POW10[frac_digits] * multiplier
+    if value >= _INT64_LIMIT:
+        return FALLBACK
+    return int(value)
+
+
+@njit(cache=True)
+def parse_lines(buf: np.ndarray) -> np.ndarray:
+    """Parse each newline-delimited size in a uint8 buffer.
+
+    Returns one int64 per line: the size in bytes, BLANK, or FALLBACK.
+    """
+    n = buf.shape[0]
+    count = 1
+    for i in range(n):
+        if buf[i] == 10:
+            count += 1
+
+    out = np.empty(count, dtype=np.int64)
+    line = 0
+    start = 0
+    for i in range(n + 1):
+        if i == n or buf[i] == 10:
+            out[line] = _parse_line(buf, start, i)
+            line += 1
+            start = i + 1
+    return out
@@ -2,11 +2,19 @@
 Formatting utilities for terminal output.
 
 Provides human-readable formatting for sizes, durations, counts,
-and path truncation.
+path truncation, and message templates.
 """
 
-import re
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
 from datetime import timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
 
 # Size constants
 KB = 1024
@@ -14,6 +22,33 @@ MB = KB * 1024
 GB = MB * 1024
 TB = GB * 1024
 
+# (divisor, format) per power-of-1024 unit, indexed by (bit_length - 1) // 10
+_SIZE_TABLE = (
+    (1, "{} B"),
+    (KB, "{:.1f} KB"),
+    (MB, "{:.1f} MB"),
+    (GB, "{:.1f} GB"),
+    (TB, "{:.2f} TB"),
+)
+
+# Lower bound of each _SIZE_TABLE unit after bytes, for bulk bucketing
+_SIZE_BOUNDS = (KB, MB, GB, TB)
+
+# Largest size the NumPy bulk helpers can hold (int64)
+_INT64_MAX = 2**63 - 1
+
+# Multipliers keyed by the prefix letter of a "KB"/"MB"/... unit suffix
+_SIZE_MULTIPLIERS = {
+    "K": KB,
+    "M": MB,
+    "G": GB,
+    "T": TB,
+}
+
+# Argument types whose str() matches format(value, "") exactly, so the
+# printf-style fast path in compile_fmt renders them identically
+_PLAIN_TYPES = (str, int, float)
+
 
 def human_size(bytes_: int) -> str:
     """Format a byte count as a human-readable string.
@@ -30,15 +65,65 @@ def human_size(bytes_: int) -> str:
         >>> human_size(1024 * 1024 * 100)
         '100.0 MB'
     """
-    if bytes_ >= TB:
-        return f"{bytes_ / TB:.2f} TB"
-    if bytes_ >= GB:
-        return f"{bytes_ / GB:.1f} GB"
-    if bytes_ >= MB:
-        return f"{bytes_ / MB:.1f} MB"
-    if bytes_ >= KB:
-        return f"{bytes_ / KB:.1f} KB"
-    return f"{bytes_} B"
+    if bytes_ < KB:
+        return f"{bytes_} B"
+
+    try:
+        # int() also accepts floats and NumPy integers; flooring keeps the
+        # unit the same because every unit boundary is a whole number
+        idx = min((int(bytes_).bit_length() - 1) // 10, len(_SIZE_TABLE) - 1)
+    except OverflowError:
+        # inf
+        idx = len(_SIZE_TABLE) - 1
+    except ValueError:
+        # nan
+        idx = 0
+    divisor, fmt = _SIZE_TABLE[idx]
+    return fmt.format(bytes_ / divisor)
+
+
+def human_size_array(sizes: Iterable[int]) -> list[str]:
+    """Format many byte counts at once.
+
+    Picks every unit in a single NumPy pass, leaving only the string
+    formatting per element. Output matches calling human_size on each value.
+    Requires NumPy (``pip install "pintui[numpy]"``).
+
+    Args:
+        sizes: Byte counts, such as a list, a generator or a NumPy integer
+            array.
+
+    Returns:
+        Human-readable size strings, in input order.
+
+    Raises:
+        ValueError: If a size does not fit in a signed 64-bit integer.
+
+    Example:
+        >>> human_size_array([512, 2048, 5 * 1024 * 1024])
+        ['512 B', '2.0 KB', '5.0 MB']
+    """
+    import numpy as np
+
+    # Generators and other one-shot iterables are materialized first
+    raw = np.asarray(sizes if isinstance(sizes, np.ndarray) else list(sizes))
+    # uint64 values past the int64 range would wrap to negative sizes
+    if raw.dtype.kind == "u" and raw.size and raw.max() > _INT64_MAX:
+        raise ValueError(f"Size out of range: {raw.max()}")
+    try:
+        values = raw.astype(np.int64).ravel()
+    except OverflowError:
+        raise ValueError("Size out of range") from None
+    units = np.searchsorted(_SIZE_BOUNDS, values, side="right")
+
+    out = []
+    for value, unit in zip(values.tolist(), units.tolist()):
+        if unit == 0:
+            out.append(f"{value} B")
+        else:
+            divisor, fmt = _SIZE_TABLE[unit]
+            out.append(fmt.format(value / divisor))
+    return out
 
 
 def parse_size(size_str: str) -> int:
@@ -65,23 +150,76 @@ def parse_size(size_str: str) -> int:
     if not size_str:
         raise ValueError("Empty size string")
 
-    # Match number and optional unit
-    match = re.match(r"^(\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)?$", size_str)
-    if not match:
+    # Scan the unit suffix from the right: optional "B", optionally
+    # preceded by one of K/M/G/T.
+    num = size_str
+    multiplier = 1
+    if num.endswith("B"):
+        num = num[:-1]
+        if num and num[-1] in _SIZE_MULTIPLIERS:
+            multiplier = _SIZE_MULTIPLIERS[num[-1]]
+            num = num[:-1]
+    num = num.rstrip()
+
+    # Accept only plain decimals ("10", "1.5"); float() alone would also
+    # take signs, exponents, underscores, "inf" and "nan".
+    int_part, dot, frac_part = num.partition(".")
+    if not int_part.isdecimal() or (dot and not frac_part.isdecimal()):
         raise ValueError(f"Invalid size format: {size_str}")
 
-    value = float(match.group(1))
-    unit = match.group(2) or "B"
+    return int(float(num) * multiplier)
+
+
+def parse_size_many(data: bytes) -> NDArray[np.int64]:
+    """Parse newline-delimited size strings in bulk.
+
+    Each non-blank line follows the parse_size format. With numba installed
+    (``pip install "pintui[numba]"``) the whole buffer is parsed in one
+    compiled pass; otherwise every line goes through parse_size. Requires
+    NumPy, and sizes must fit in a signed 64-bit integer.
+
+    Args:
+        data: Size strings separated by newlines, like b"100MB\\n1.5GB\\n".
+
+    Returns:
+        Sizes in bytes, one per non-blank line.
+
+    Raises:
+        ValueError: If any line cannot be parsed or is too large for int64.
+
+    Example:
+        >>> parse_size_many(b"1KB\\n2MB\\n").tolist()
+        [1024, 2097152]
+    """
+    import numpy as np
+
+    try:
+        from pintui._fast_format import BLANK, FALLBACK, parse_lines
+    except ImportError:
+        parsed = [_parse_size_int64(line) for line in data.split(b"\n") if line.strip()]
+        return np.array(parsed, dtype=np.int64)
 
-    multipliers = {
-        "B": 1,
-        "KB": KB,
-        "MB": MB,
-        "GB": GB,
-        "TB": TB,
-    }
+    values: NDArray[np.int64] = parse_lines(np.frombuffer(data, dtype=np.uint8))
 
-    return int(value * multipliers[unit])
+    # Lines the kernel cannot parse exactly (or at all) go through
+    # parse_size, which either handles them or raises the usual error
+    fallback = np.flatnonzero(values == FALLBACK)
+    if fallback.size:
+        lines = data.split(b"\n")
+        for i in fallback.tolist():
+            values[i] = _parse_size_int64(lines[i])
+
+    sizes: NDArray[np.int64] = values[values != BLANK]
+    return sizes
+
+
+def _parse_size_int64(line: bytes) -> int:
+    """Parse one line for parse_size_many, which stores sizes as int64."""
+    size_str = line.decode()
+    size = parse_size(size_str)
+    if size > _INT64_MAX:
+        raise ValueError(f"Invalid size format: {size_str}")
+    return size
 
 
 def human_duration(duration: timedelta | float) -> str:
@@ -99,11 +237,27 @@ def human_duration(duration: timedelta | float) -> str:
         >>> human_duration(0.5)
         '500ms'
     """
-    if isinstance(duration, timedelta):
-        total_seconds = duration.total_seconds()
-    else:
-        total_seconds = duration
+    return human_duration_s(
+        duration.total_seconds() if isinstance(duration, timedelta) else duration
+    )
+
+
+def human_duration_s(total_seconds: float) -> str:
+    """Format a duration given in seconds as a human-readable string.
+
+    Same as human_duration, without the timedelta check, for callers that
+    already hold elapsed seconds.
 
+    Args:
+        total_seconds: Duration in seconds.
+
+    Returns:
+        Human-readable duration string.
+
+    Example:
+        >>> human_duration_s(90)
+        '1m 30s'
+    """
     if total_seconds < 0:
         total_seconds = 0
 
@@ -113,19 +267,17 @@ def human_duration(duration: timedelta | float) -> str:
     if total_ms < 1000:
         return f"{total_ms}ms"
 
-    total_secs = total_seconds
+    # Derive each unit with a single divmod on the integer count
+    total_secs = total_ms // 1000
     if total_secs < 60:
-        return f"{total_secs:.1f}s"
-
-    minutes = int(total_secs // 60)
-    secs = int(total_secs % 60)
+        return f"{total_seconds:.1f}s"
 
+    minutes, secs = divmod(total_secs, 60)
     if minutes < 60:
-        return f"{minutes}m {secs}s"
+        return str(minutes) + "m " + str(secs) + "s"
 
-    hours = minutes // 60
-    mins = minutes % 60
-    return f"{hours}h {mins}m"
+    hours, mins = divmod(minutes, 60)
+    return str(hours) + "h " + str(mins) + "m"
 
 
 def pluralize(count: int, singular: str, plural: str) -> str:
@@ -145,9 +297,8 @@ def pluralize(count: int, singular: str, plural: str) -> str:
         >>> pluralize(5, "file", "files")
         '5 files'
     """
-    if count == 1:
-        return f"{count} {singular}"
-    return f"{count} {plural}"
+    # Plain concatenation; cheaper than f-string formatting for an int + word
+    return str(count) + " " + (singular if count == 1 else plural)
 
 
 def truncate_path(path: str, max_len: int) -> str:
@@ -169,19 +320,55 @@ def truncate_path(path: str, max_len: int) -> str:
     if not path:
         return ""
 
-    if len(path) <= max_len:
+    n = len(path)
+    if n <= max_len:
         return path
 
     if max_len <= 3:
         return "..."
 
-    # Find a good break point (path separator)
-    suffix_len = max_len - 3  # Account for "..."
-    suffix = path[-suffix_len:]
+    # Keep the last max_len - 3 characters (accounting for "...")
+    start = n - (max_len - 3)
+
+    # Try to break at a path separator for cleaner output, searching the
+    # original string in place so only the final result is sliced
+    # (find returns -1 or an index >= start)
+    sep_idx = path.find("/", start, n - 1)
+    return "..." + path[max(sep_idx, start) :]
+
+
+@lru_cache(maxsize=256)
+def compile_fmt(fmt: str) -> Callable[..., str]:
+    """Compile a str.format template into a reusable formatter.
+
+    Templates that only use bare ``{}`` fields are rewritten once into a
+    printf-style template, skipping str.format's parser on each call. Other
+    templates (named or indexed fields, format specs, escaped braces) and
+    arguments outside str/int/float fall back to ``fmt.format``, so the
+    output is always identical to ``fmt.format(*args)``.
+
+    Args:
+        fmt: Format string.
+
+    Returns:
+        Callable taking the format arguments and returning the string.
+
+    Example:
+        >>> render = compile_fmt("Processing {} files")
+        >>> render(10)
+        'Processing 10 files'
+    """
+    fields = fmt.count("{}")
+    literal = fmt.replace("{}", "")
+    if "{" in literal or "}" in literal:
+        return fmt.format
+
+    template = fmt.replace("%", "%%").replace("{}", "%s")
+    fallback = fmt.format
 
-    # Try to break at a path separator for cleaner output
-    sep_idx = suffix.find("/")
-    if sep_idx > 0 and sep_idx < len(suffix) - 1:
-        suffix = suffix[sep_idx:]
+    def render(*args: object) -> str:
+        if len(args) == fields and all(type(arg) in _PLAIN_TYPES for arg in args):
+            return template % args
+        return fallback(*args)
 
-    return f"...{suffix}"
+    return render
@@ -5,10 +5,39 @@ Provides functions for organizing terminal output with headers,
 sections, key-value pairs, steps, dividers, and indentation.
 """
 
-from colorama import init
+from __future__ import annotations
 
-# Initialize colorama for cross-platform support
-init()
+import io
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, TextIO
+
+from pintui.format import compile_fmt
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+
+def _write(text: str) -> None:
+    """Write text to stdout, dropping it when there is no stdout (pythonw).
+
+    Every function writes its whole line, newline included, in a single
+    sys.stdout.write call (print() issues a second write for the newline).
+    sys.stdout is looked up per call so redirection keeps working.
+    """
+    out = sys.stdout
+    if out is not None:
+        out.write(text)
+
+
+# Indentation prefixes for the common nesting depths
+_INDENTS = tuple("  " * i for i in range(33))
+
+
+@lru_cache(maxsize=128)
+def _rule(width: int) -> str:
+    """Return a horizontal rule of the given width, cached per width."""
+    return "─" * width
 
 
 def header(title: str) -> None:
@@ -26,9 +55,7 @@ def header(title: str) -> None:
     # Calculate width accounting for unicode characters
     width = len(title)
     # Use box drawing character for underline
-    underline = "─" * (width + 8)
-    print(f"\n{title}")
-    print(underline)
+    _write(f"\n{title}\n{_rule(width + 8)}\n")
 
 
 def section(title: str) -> None:
@@ -42,7 +69,7 @@ def section(title: str) -> None:
 
         Server Settings
     """
-    print(f"\n{title}")
+    _write(f"\n{title}\n")
 
 
 def kv(key: str, value: str) -> None:
@@ -56,7 +83,7 @@ def kv(key: str, value: str) -> None:
         >>> kv("Environment", "production")
           Environment: production
     """
-    print(f"  {key}: {value}")
+    _write(f"  {key}: {value}\n")
 
 
 def kvf(key: str, fmt: str, *args: object) -> None:
@@ -71,7 +98,7 @@ def kvf(key: str, fmt: str, *args: object) -> None:
         >>> kvf("Files", "{} processed", 42)
           Files: 42 processed
     """
-    kv(key, fmt.format(*args))
+    kv(key, compile_fmt(fmt)(*args))
 
 
 def step(current: int, total: int, msg: str) -> None:
@@ -86,7 +113,7 @@ def step(current: int, total: int, msg: str) -> None:
         >>> step(1, 5, "Initializing")
         [1/5] Initializing
     """
-    print(f"[{current}/{total}] {msg}")
+    _write(f"[{current}/{total}] {msg}\n")
 
 
 def stepf(current: int, total: int, fmt: str, *args: object) -> None:
@@ -98,7 +125,7 @@ def stepf(current: int, total: int, fmt: str, *args: object) -> None:
         fmt: Format string for the message.
         *args: Format arguments.
     """
-    step(current, total, fmt.format(*args))
+    step(current, total, compile_fmt(fmt)(*args))
 
 
 def blank() -> None:
@@ -108,7 +135,7 @@ def blank() -> None:
         >>> blank()
 
     """
-    print()
+    _write("\n")
 
 
 def divider(width: int = 40) -> None:
@@ -123,7 +150,7 @@ def divider(width: int = 40) -> None:
     """
     if width <= 0:
         return
-    print("─" * width)
+    _write(_rule(width) + "\n")
 
 
 def indent(level: int, msg: str) -> None:
@@ -137,8 +164,8 @@ def indent(level: int, msg: str) -> None:
         >>> indent(2, "Nested item")
             Nested item
     """
-    spaces = "  " * level
-    print(f"{spaces}{msg}")
+    spaces = _INDENTS[level] if 0 <= level < len(_INDENTS) else "  " * level
+    _write(spaces + msg + "\n")
 
 
 def indentf(level: int, fmt: str, *args: object) -> None:
@@ -149,4 +176,61 @@ def indentf(level: int, fmt: str, *args: object) -> None:
         fmt: Format string for the message.
         *args: Format arguments.
     """
-    indent(level, fmt.format(*args))
+    indent(level, compile_fmt(fmt)(*args))
+
+
+class LayoutBuffer:
+    """Collect layout output and write it to stdout in a single call.
+
+    While active, ``sys.stdout`` is redirected to an in-memory buffer, so any
+    pintui output (or plain ``print``) is batched. The buffer is flushed to
+    the original stdout on exit, even if an exception was raised. Because the
+    redirect is process-wide, avoid printing from other threads meanwhile.
+
+    Example:
+        >>> with buffered():
+        ...     kv("Environment", "production")
+        ...     kv("Region", "us-east-1")
+    """
+
+    def __init__(self) -> None:
+        """Create an inactive layout buffer."""
+        self._buf = io.StringIO()
+        self._old: TextIO | None = None
+
+    def __enter__(self) -> LayoutBuffer:
+        """Start redirecting stdout into the buffer."""
+        self._buf = io.StringIO()
+        self._old = sys.stdout
+        sys.stdout = self._buf
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Restore stdout and write the buffered output in one call."""
+        old = self._old
+        if old is None:
+            return
+        sys.stdout = old
+        self._old = None
+        old.write(self._buf.getvalue())
+        old.flush()
+
+
+def buffered() -> LayoutBuffer:
+    """Batch layout output into a single write to stdout.
+
+    Returns:
+        LayoutBuffer to use as a context manager.
+
+    Example:
+        >>> with buffered():
+        ...     header("Configuration")
+        ...     kv("Environment", "production")
+        ...     kv("Region", "us-east-1")
+    """
+    return LayoutBuffer()
@@ -5,16 +5,69 @@ Provides colored, icon-prefixed messages for different status types:
 info (blue), success (green), warn (yellow), error (red), and dim (gray).
 """
 
-from colorama import Fore, Style, init
+import sys
+from collections.abc import Callable
+
+from pintui._ansi import COLOR, Fore, Style, is_tty
+from pintui.format import compile_fmt
+
+# Icons matching the design tokens, with plain-text fallbacks for logs/pipes
+if COLOR:
+    _INFO_ICON = f"{Fore.BLUE}ℹ{Style.RESET_ALL}"
+    _SUCCESS_ICON = f"{Fore.GREEN}✓{Style.RESET_ALL}"
+    _WARN_ICON = f"{Fore.YELLOW}⚠{Style.RESET_ALL}"
+    _ERROR_ICON = f"{Fore.RED}✗{Style.RESET_ALL}"
+    _DIM = Style.DIM
+    _RESET = Style.RESET_ALL
+else:
+    _INFO_ICON = "i"
+    _SUCCESS_ICON = "+"
+    _WARN_ICON = "!"
+    _ERROR_ICON = "x"
+    _DIM = ""
+    _RESET = ""
+
+# Line prefixes/suffixes built once, so each message is a single concatenation
+_INFO_PREFIX = _INFO_ICON + " "
+_SUCCESS_PREFIX = _SUCCESS_ICON + " "
+_WARN_PREFIX = _WARN_ICON + " "
+_ERROR_PREFIX = _ERROR_ICON + " "
+_DIM_PREFIX = _DIM + "  "
+_DIM_SUFFIX = _RESET
+
+# On Windows colorama translates ANSI codes in its stdout wrapper, so raw
+# byte writes that bypass it are only safe elsewhere.
+_RAW_WRITES = sys.platform != "win32"
+
+
+def _emit(prefix: str, msg: str, suffix: str = "") -> None:
+    """Write one message line to stdout.
+
+    Terminals get the line, encoded the same way the text stream would
+    encode it, in a single write to the underlying byte buffer; pipes and
+    captured streams fall back to print().
+    """
+    out = sys.stdout
+    if out is None:
+        # No console at all (pythonw); print() would drop the line too
+        return
+    if _RAW_WRITES and is_tty(out):
+        out.flush()
+        line = prefix + msg + suffix + "\n"
+        out.buffer.write(line.encode(out.encoding, out.errors or "strict"))
+        out.buffer.flush()
+    else:
+        print(prefix + msg + suffix)
+
+
+def _template(prefix: str, fmt: str, suffix: str = "") -> Callable[..., None]:
+    """Bind a compiled format string to a message prefix/suffix."""
+    render = compile_fmt(fmt)
 
-# Initialize colorama for cross-platform support
-init()
+    def emit(*args: object) -> None:
+        _emit(prefix, render(*args), suffix)
 
-# Icons matching the design tokens
-_INFO_ICON = f"{Fore.BLUE}ℹ{Style.RESET_ALL}"
-_SUCCESS_ICON = f"{Fore.GREEN}✓{Style.RESET_ALL}"
-_WARN_ICON = f"{Fore.YELLOW}⚠{Style.RESET_ALL}"
-_ERROR_ICON = f"{Fore.RED}✗{Style.RESET_ALL}"
+    return emit
 
 
 def info(msg: str) -> None:
@@ -27,7 +80,7 @@ def info(msg: str) -> None:
         >>> info("Starting process...")
         ℹ Starting process...
     """
-    print(f"{_INFO_ICON} {msg}")
+    _emit(_INFO_PREFIX, msg)
 
 
 def infof(fmt: str, *args: object) -> None:
@@ -41,7 +94,29 @@ def infof(fmt: str, *args: object) -> None:
         >>> infof("Processing {} files", 10)
         ℹ Processing 10 files
     """
-    info(fmt.format(*args))
+    info(compile_fmt(fmt)(*args))
+
+
+def info_template(fmt: str) -> Callable[..., None]:
+    """Compile an info message template for repeated use.
+
+    Parses the format string once, so loops that emit the same kind of
+    message avoid re-parsing it on every call.
+
+    Args:
+        fmt: Format string.
+
+    Returns:
+        Callable taking the format arguments and printing the info message.
+
+    Example:
+        >>> processing = info_template("Processing {}")
+        >>> for name in ["a.txt", "b.txt"]:
+        ...     processing(name)
+        ℹ Processing a.txt
+        ℹ Processing b.txt
+    """
+    return _template(_INFO_PREFIX, fmt)
 
 
 def success(msg: str) -> None:
@@ -54,7 +129,7 @@ def success(msg: str) -> None:
         >>> success("Operation completed")
         ✓ Operation completed
     """
-    print(f"{_SUCCESS_ICON} {msg}")
+    _emit(_SUCCESS_PREFIX, msg)
 
 
 def successf(fmt: str, *args: object) -> None:
@@ -64,7 +139,19 @@ def successf(fmt: str, *args: object) -> None:
         fmt: Format string.
         *args: Format arguments.
     """
-    success(fmt.format(*args))
+    success(compile_fmt(fmt)(*args))
+
+
+def success_template(fmt: str) -> Callable[..., None]:
+    """Compile a success message template for repeated use.
+
+    Args:
+        fmt: Format string.
+
+    Returns:
+        Callable taking the format arguments and printing the success message.
+    """
+    return _template(_SUCCESS_PREFIX, fmt)
 
 
 def warn(msg: str) -> None:
@@ -77,7 +164,7 @@ def warn(msg: str) -> None:
         >>> warn("Rate limit approaching")
         ⚠ Rate limit approaching
     """
-    print(f"{_WARN_ICON} {msg}")
+    _emit(_WARN_PREFIX, msg)
 
 
 def warnf(fmt: str, *args: object) -> None:
@@ -87,7 +174,19 @@ def warnf(fmt: str, *args: object) -> None:
         fmt: Format string.
         *args: Format arguments.
     """
-    warn(fmt.format(*args))
+    warn(compile_fmt(fmt)(*args))
+
+
+def warn_template(fmt: str) -> Callable[..., None]:
+    """Compile a warning message template for repeated use.
+
+    Args:
+        fmt: Format string.
+
+    Returns:
+        Callable taking the format arguments and printing the warning message.
+    """
+    return _template(_WARN_PREFIX, fmt)
 
 
 def error(msg: str) -> None:
@@ -100,7 +199,7 @@ def error(msg: str) -> None:
         >>> error("Connection failed")
         ✗ Connection failed
     """
-    print(f"{_ERROR_ICON} {msg}")
+    _emit(_ERROR_PREFIX, msg)
 
 
 def errorf(fmt: str, *args: object) -> None:
@@ -110,7 +209,19 @@ def errorf(fmt: str, *args: object) -> None:
         fmt: Format string.
         *args: Format arguments.
     """
-    error(fmt.format(*args))
+    error(compile_fmt(fmt)(*args))
+
+
+def error_template(fmt: str) -> Callable[..., None]:
+    """Compile an error message template for repeated use.
+
+    Args:
+        fmt: Format string.
+
+    Returns:
+        Callable taking the format arguments and printing the error message.
+    """
+    return _template(_ERROR_PREFIX, fmt)
 
 
 def dim(msg: str) -> None:
@@ -123,7 +234,7 @@ def dim(msg: str) -> None:
         >>> dim("Debug: internal state updated")
           Debug: internal state updated
     """
-    print(f"{Style.DIM}  {msg}{Style.RESET_ALL}")
+    _emit(_DIM_PREFIX, msg, _DIM_SUFFIX)
 
 
 def dimf(fmt: str, *args: object) -> None:
@@ -133,4 +244,16 @@ def dimf(fmt: str, *args: object) -> None:
         fmt: Format string.
         *args: Format arguments.
     """
-    dim(fmt.format(*args))
+    dim(compile_fmt(fmt)(*args))
+
+
+def dim_template(fmt: str) -> Callable[..., None]:
+    """Compile a dimmed message template for repeated use.
+
+    Args:
+        fmt: Format string.
+
+    Returns:
+        Callable taking the format arguments and printing the dimmed message.
+    """
+    return _template(_DIM_PREFIX, fmt, _DIM_SUFFIX)
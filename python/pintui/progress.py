@@ -7,24 +7,342 @@ for long-running operations.
 
 from __future__ import annotations
 
+import atexit
+import itertools
+import os
 import sys
+import threading
+import time
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
-from colorama import Fore, Style, init
-from halo import Halo
-from tqdm import tqdm
+from pintui._ansi import COLOR, Fore, Style, is_tty
 
 if TYPE_CHECKING:
     from types import TracebackType
+    from typing import TextIO
+
+# Icons matching design tokens, with plain-text fallbacks for logs/pipes
+if COLOR:
+    _SUCCESS_ICON = f"{Fore.GREEN}✓{Style.RESET_ALL}"
+    _ERROR_ICON = f"{Fore.RED}✗{Style.RESET_ALL}"
+    _WARN_ICON = f"{Fore.YELLOW}⚠{Style.RESET_ALL}"
+    _SKIP_ICON = f"{Style.DIM}○{Style.RESET_ALL}"
+    _SKIPPED = f"{Style.DIM}(skipped){Style.RESET_ALL}"
+else:
+    _SUCCESS_ICON = "+"
+    _ERROR_ICON = "x"
+    _WARN_ICON = "!"
+    _SKIP_ICON = "-"
+    _SKIPPED = "(skipped)"
+
+# Final-state line prefixes: return to column 0, then icon and a space
+_SUCCESS_LINE = "\r" + _SUCCESS_ICON + " "
+_ERROR_LINE = "\r" + _ERROR_ICON + " "
+_WARN_LINE = "\r" + _WARN_ICON + " "
+
+# Fixed parts of a skipped-stage line around "[n/total] msg"
+_SKIP_LINE_PREFIX = "  " + _SKIP_ICON + " "
+_SKIP_LINE_SUFFIX = " " + _SKIPPED
+
+
+# Spinner animation, matching the [spinner] design tokens
+_SPINNER_FRAMES = ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")
+_SPINNER_INTERVAL = 0.08
+_SPINNER_COLOR = Fore.CYAN if COLOR else ""
+_SPINNER_RESET = Style.RESET_ALL if COLOR else ""
+
+# Everything in a spinner frame before its message, one entry per glyph
+_SPINNER_PREFIXES = tuple(
+    f"\r{_SPINNER_COLOR}{glyph}{_SPINNER_RESET} " for glyph in _SPINNER_FRAMES
+)
+
+# Progress bar, matching the [progress_bar] design tokens
+_BAR_WIDTH = 40
+_BAR_FILLED = "━"
+_BAR_EMPTY = "─"
+
+# add() checks for a redraw about this many times over a bar's total: four
+# per cell, so the fill never lags by more than a quarter cell
+_BAR_CHECKS = _BAR_WIDTH * 4
+
+# Every possible bar body, indexed by the number of filled cells
+_BAR_CELLS = tuple(
+    _BAR_FILLED * filled + _BAR_EMPTY * (_BAR_WIDTH - filled) for filled in range(_BAR_WIDTH + 1)
+)
+
+# Text between the bar body and the count for every whole percentage
+_BAR_PERCENTS = tuple(f"] {percent:3d}% (" for percent in range(101))
+
+# Terminal control sequences
+_CLEAR_LINE = "\x1b[K"
+_HIDE_CURSOR = "\x1b[?25l"
+_SHOW_CURSOR = "\x1b[?25h"
+
+
+# On a terminal, frames go straight to the file descriptor with one
+# os.writev() each, skipping the text and buffer layers. Windows is excluded
+# because colorama translates ANSI codes in its stream wrappers (and it has
+# no writev).
+# The process's original streams are used, so importing this module while
+# stdout is redirected does not disable the raw path for good; _write()
+# only takes it while sys.stdout is the original stream again.
+def _raw_fd(stream: TextIO | None) -> int:
+    """Return the terminal file descriptor behind a stream, or -1."""
+    if stream is None or not hasattr(os, "writev") or not is_tty(stream):
+        return -1
+    return stream.fileno()
+
+
+_STDOUT = sys.__stdout__
+_FD = _raw_fd(_STDOUT)
+_STDERR = sys.__stderr__
+_ERR_FD = _raw_fd(_STDERR)
+
+
+def _write(*parts: str) -> None:
+    """Write one complete frame to stdout and flush it.
+
+    A frame may be passed in pieces; on a terminal they are gathered by a
+    single os.writev() call rather than joined first, so each frame still
+    reaches the terminal in one write.
+    """
+    out = sys.stdout
+    _write_to(out, _FD if out is _STDOUT else -1, parts)
+
+
+def _write_err(*parts: str) -> None:
+    """Write one complete frame to stderr and flush it, like _write()."""
+    out = sys.stderr
+    _write_to(out, _ERR_FD if out is _STDERR else -1, parts)
+
+
+def _write_to(out: TextIO | None, fd: int, parts: tuple[str, ...]) -> None:
+    if out is None:
+        # No console at all (pythonw); print() would drop the output too
+        return
+    if fd >= 0:
+        # Anything print() left in the text buffer must go out first
+        out.flush()
+        # Encode as the text stream would, honouring its encoding and errors
+        encoding, errors = out.encoding, out.errors or "strict"
+        chunks = [part.encode(encoding, errors) for part in parts]
+        try:
+            written = os.writev(fd, chunks)
+            if written < sum(map(len, chunks)):
+                data = b"".join(chunks)[written:]
+                while data:
+                    data = data[os.write(fd, data) :]
+            return
+        except OSError:
+            pass
+    out.write("".join(parts))
+    out.flush()
+
+
+class _SpinnerService:
+    """Animate every active spinner from one shared background thread.
+
+    Each tick renders all live spinners into a single write, so the cost is
+    one thread and one write per tick no matter how many spinners run. The
+    thread exits once the last spinner stops and is restarted on demand.
+
+    The first frame is painted on the first tick, so a spinner stopped
+    within one interval never draws, and stopping it writes only its final
+    line, if any.
+    """
+
+    def __init__(self) -> None:
+        # Guards the spinner registry and serializes frame writes, so a
+        # spinner that has stopped never gets repainted over its final line
+        self._lock = threading.Lock()
+        self._spinners: dict[_Spinner, None] = {}
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+        # Whether the spinner line is in use: cursor hidden, frames painted
+        self._drawn = False
+        # Visible width of what is currently painted on the spinner line
+        self._width = 0
+
+    def add(self, spinner: _Spinner) -> None:
+        """Register a spinner, to be painted from the next tick on."""
+        with self._lock:
+            self._spinners[spinner] = None
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="pintui-spinner", daemon=True
+                )
+                self._thread.start()
+
+    def remove(self, spinner: _Spinner, final: str = "") -> None:
+        """Deregister a spinner, clear its line and write its final line."""
+        with self._lock:
+            teardown = ""
+            if spinner in self._spinners:
+                del self._spinners[spinner]
+                if self._drawn:
+                    self._width = 0
+                    self._drawn = bool(self._spinners)
+                    teardown = "\r" + _CLEAR_LINE + ("" if self._drawn else _SHOW_CURSOR)
+            if teardown or final:
+                _write(teardown, final)
+        self._wakeup.set()
+
+    def write_above(self, text: str) -> bool:
+        """Write complete lines above the spinner line, if any spinner is live.
+
+        The spinner line is cleared, the text written and the spinners
+        repainted below it, all in one write.
+
+        Returns:
+            False if no spinner is active and nothing was written.
+        """
+        with self._lock:
+            if not self._spinners:
+                return False
+            self._width = 0
+            frames = [self._paint(spinner) for spinner in self._spinners]
+            _write("\r" + _CLEAR_LINE if self._drawn else _HIDE_CURSOR, text, *frames)
+            self._drawn = True
+        return True
+
+    def stop_all(self) -> None:
+        """Stop every spinner; registered to run at interpreter exit."""
+        for spinner in list(self._spinners):
+            spinner.stop()
+
+    def _run(self) -> None:
+        # Ticks follow fixed monotonic deadlines; a wakeup (a spinner being
+        # removed) only checks for exit and does not paint an early frame
+        deadline = time.monotonic() + _SPINNER_INTERVAL
+        while True:
+            self._wakeup.wait(max(deadline - time.monotonic(), 0.0))
+            self._wakeup.clear()
+            with self._lock:
+                if not self._spinners:
+                    self._thread = None
+                    return
+                now = time.monotonic()
+                if now < deadline:
+                    continue
+                frames = [self._paint(spinner) for spinner in self._spinners]
+                _write("" if self._drawn else _HIDE_CURSOR, *frames)
+                self._drawn = True
+            deadline += _SPINNER_INTERVAL
+            if deadline <= now:
+                # Skip missed ticks rather than painting them in a burst
+                deadline = now + _SPINNER_INTERVAL
+
+    def _paint(self, spinner: _Spinner) -> str:
+        """Return the spinner's next frame, padded over any longer previous one.
+
+        Frames overwrite the line in place instead of clearing it first, so
+        only a shrinking line needs trailing spaces.
+        """
+        pad = self._width - spinner.width
+        self._width = spinner.width
+        if pad > 0:
+            return spinner.next_frame() + " " * pad
+        return spinner.next_frame()
+
+
+_SERVICE = _SpinnerService()
+atexit.register(_SERVICE.stop_all)
+
+
+class _Spinner:
+    """Animated spinner line, painted by the shared _SpinnerService.
+
+    The complete frame strings are built once per message and cycled with
+    itertools.cycle, so each tick is a single C-level next() call.
+    """
+
+    next_frame: Callable[[], str]
+    """Return the next animation frame, advancing the glyph."""
+
+    def __init__(self, text: str) -> None:
+        self.running = False
+        self._text = ""
+        self._frames: tuple[str, ...] = ()
+        self.text = text
+
+    @property
+    def text(self) -> str:
+        """Message shown after the spinner glyph."""
+        return self._text
+
+    @text.setter
+    def text(self, text: str) -> None:
+        if text == self._text and self._frames:
+            return
+        self._text = text
+        # Visible columns of a frame: glyph, space, text
+        self.width = len(text) + 2
+        self._frames = tuple(prefix + text for prefix in _SPINNER_PREFIXES)
+        self.next_frame = itertools.cycle(self._frames).__next__
+
+    def start(self, text: str | None = None) -> _Spinner:
+        if text is not None:
+            self.text = text
+        if not self.running:
+            self.running = True
+            _SERVICE.add(self)
+        return self
+
+    def stop(self, final: str = "") -> _Spinner:
+        if self.running:
+            self.running = False
+            _SERVICE.remove(self, final)
+        elif final:
+            self.write_line(final)
+        return self
+
+    def write_line(self, line: str) -> None:
+        """Write a complete line without touching this spinner's state.
+
+        The line goes above any spinner still animating, so it never lands
+        on top of another spinner's frame.
+        """
+        if not _SERVICE.write_above(line):
+            _write(line)
+
+
+class _NullSpinner:
+    """Stand-in for _Spinner when stdout is not a terminal.
+
+    Draws nothing while running; only the final status line is written,
+    as a plain line without the carriage return used to overwrite frames.
+    """
 
-# Initialize colorama
-init()
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.running = False
 
-# Icons matching design tokens
-_SUCCESS_ICON = f"{Fore.GREEN}✓{Style.RESET_ALL}"
-_ERROR_ICON = f"{Fore.RED}✗{Style.RESET_ALL}"
-_WARN_ICON = f"{Fore.YELLOW}⚠{Style.RESET_ALL}"
-_SKIP_ICON = f"{Style.DIM}○{Style.RESET_ALL}"
+    def start(self, text: str | None = None) -> _NullSpinner:
+        if text is not None:
+            self.text = text
+        self.running = True
+        return self
+
+    def stop(self, final: str = "") -> _NullSpinner:
+        self.running = False
+        if final:
+            self.write_line(final)
+        return self
+
+    def write_line(self, line: str) -> None:
+        """Write a complete line as plain text."""
+        _write(line.lstrip("\r"))
+
+
+def _make_spinner(text: str) -> _Spinner | _NullSpinner:
+    """Create the spinner backend for the current output stream."""
+    # Animating only makes sense on a terminal; elsewhere (CI logs, pipes,
+    # redirected or captured output) it would repaint frames nobody sees.
+    # Checked per spinner, against whatever stdout is at that moment.
+    if not is_tty(sys.stdout):
+        return _NullSpinner(text)
+    return _Spinner(text)
 
 
 class SpinnerHandle:
@@ -49,13 +367,8 @@ class SpinnerHandle:
             msg: Initial spinner message.
         """
         self._msg = msg
-        self._halo = Halo(
-            text=msg,
-            spinner="dots",
-            color="cyan",
-            stream=sys.stdout,
-        )
-        self._halo.start()
+        self._spinner = _make_spinner(msg)
+        self._spinner.start()
 
     def __enter__(self) -> SpinnerHandle:
         """Enter context manager."""
@@ -68,7 +381,7 @@ class SpinnerHandle:
         exc_tb: TracebackType | None,
     ) -> None:
         """Exit context manager, clearing spinner if not already finished."""
-        if self._halo.spinner_id is not None:
+        if self._spinner.running:
             self.clear()
 
     def update_message(self, msg: str) -> None:
@@ -78,7 +391,7 @@ class SpinnerHandle:
             msg: New message to display.
         """
         self._msg = msg
-        self._halo.text = msg
+        self._spinner.text = msg
 
     def success(self, msg: str) -> None:
         """Stop spinner and show success message.
@@ -86,8 +399,7 @@ class SpinnerHandle:
         Args:
             msg: Success message to display.
         """
-        self._halo.stop()
-        print(f"\r{_SUCCESS_ICON} {msg}")
+        self._spinner.stop(_SUCCESS_LINE + msg + "\n")
 
     def error(self, msg: str) -> None:
         """Stop spinner and show error message.
@@ -95,8 +407,7 @@ class SpinnerHandle:
         Args:
             msg: Error message to display.
         """
-        self._halo.stop()
-        print(f"\r{_ERROR_ICON} {msg}")
+        self._spinner.stop(_ERROR_LINE + msg + "\n")
 
     def warn(self, msg: str) -> None:
         """Stop spinner and show warning message.
@@ -104,14 +415,12 @@ class SpinnerHandle:
         Args:
             msg: Warning message to display.
         """
-        self._halo.stop()
-        print(f"\r{_WARN_ICON} {msg}")
+        self._spinner.stop(_WARN_LINE + msg + "\n")
 
     def clear(self) -> None:
         """Stop and clear the spinner without a message."""
-        self._halo.stop()
-        # Clear the line
-        print("\r" + " " * (len(self._msg) + 10) + "\r", end="")
+        # Stopping clears the spinner line in the same write
+        self._spinner.stop()
 
 
 def spinner(msg: str) -> SpinnerHandle:
@@ -132,7 +441,15 @@ def spinner(msg: str) -> SpinnerHandle:
 
 
 class BarHandle:
-    """Handle for controlling a progress bar.
+    """Handle for controlling a progress bar, drawn on stderr.
+
+    Redraws are throttled: add() and set() always update the count, but the
+    bar is repainted at most once per throttle interval, except when it
+    first reaches its total. add() only considers a redraw once the count has
+    grown by a fraction of the total since the last check, so tight loops
+    of small increments stay cheap. finish() always paints the final state.
+    Once finish() or clear() has been called the bar is closed: further
+    calls to either, and further updates, write nothing.
 
     Example:
         >>> bar = progress_bar(100, "Downloading")
@@ -141,19 +458,30 @@ class BarHandle:
         >>> bar.finish()
     """
 
-    def __init__(self, total: int, description: str) -> None:
+    def __init__(self, total: int, description: str, throttle_ms: int = 33) -> None:
         """Create a new progress bar.
 
         Args:
             total: Total number of units.
             description: Bar description.
+            throttle_ms: Minimum time between redraws in milliseconds.
         """
-        self._bar = tqdm(
-            total=total,
-            desc=description,
-            bar_format="{desc} {percentage:3.0f}% |{bar}| ({n_fmt}/{total_fmt})",
-            ncols=100,
-        )
+        self._total = total
+        self._value = 0
+        # Fixed text before the bar body and after the current count
+        self._head = f"\r{description} [" if description else "\r["
+        self._tail = f"/{total})"
+        self._min_interval_ns = throttle_ms * 1_000_000
+        self._last_ns = time.monotonic_ns()
+        # Last frame written, so repeating an identical frame costs no write
+        self._last_frame = ""
+        # Units add() counts down before it checks for a redraw
+        self._step = max(1, total // _BAR_CHECKS)
+        self._countdown = self._step
+        self._closed = False
+        # Count shown by the latest redraw
+        self._drawn_value = 0
+        self._render()
 
     def add(self, n: int = 1) -> None:
         """Increment the progress bar.
@@ -161,7 +489,11 @@ class BarHandle:
         Args:
             n: Amount to increment by. Defaults to 1.
         """
-        self._bar.update(n)
+        self._value += n
+        self._countdown -= n
+        if self._countdown <= 0 or self._crossed_total():
+            self._countdown = self._step
+            self._maybe_render()
 
     def set(self, n: int) -> None:
         """Set the progress bar to a specific value.
@@ -169,24 +501,92 @@ class BarHandle:
         Args:
             n: Value to set.
         """
-        self._bar.n = n
-        self._bar.refresh()
+        self._value = n
+        self._maybe_render()
 
     def finish(self) -> None:
         """Complete and close the progress bar."""
-        self._bar.close()
+        if self._closed:
+            return
+        self._closed = True
+        _write_err(self._overwrite(self._format()), "\n")
 
     def clear(self) -> None:
         """Clear the progress bar without completing."""
-        self._bar.close()
+        if self._closed:
+            return
+        self._closed = True
+        if self._last_frame:
+            _write_err("\r" + _CLEAR_LINE)
+
+    def _maybe_render(self) -> None:
+        now = time.monotonic_ns()
+        if now - self._last_ns >= self._min_interval_ns or self._crossed_total():
+            self._last_ns = now
+            self._render()
+
+    def _crossed_total(self) -> bool:
+        # Only the first update that reaches the total skips the throttle; a
+        # count running past an estimated total stays throttled
+        return self._value >= self._total > self._drawn_value
+
+    def _render(self) -> None:
+        if self._closed:
+            return
+        self._drawn_value = self._value
+        frame = self._format()
+        if frame != self._last_frame:
+            _write_err(self._overwrite(frame))
+            self._last_frame = frame
+
+    def _overwrite(self, frame: str) -> str:
+        # Pad with spaces where the previous frame was longer, instead of
+        # clearing the line before every redraw
+        pad = len(self._last_frame) - len(frame)
+        return frame + " " * pad if pad > 0 else frame
+
+    def _format(self) -> str:
+        # Integer math, so the percentage is never lowered by float rounding;
+        # an empty total counts as complete
+        total = self._total if self._total > 0 else 1
+        done = min(max(self._value, 0), total) if self._total > 0 else 1
+        return (
+            self._head
+            + _BAR_CELLS[done * _BAR_WIDTH // total]
+            + _BAR_PERCENTS[done * 100 // total]
+            + str(self._value)
+            + self._tail
+        )
 
 
-def bar(total: int, description: str = "") -> BarHandle:
-    """Create a progress bar.
+class _NullBar(BarHandle):
+    """Stand-in for BarHandle when stderr is not a terminal.
+
+    Counts as usual but only writes the final state, on finish().
+    """
+
+    def finish(self) -> None:
+        """Write the final state of the bar as a plain line."""
+        if not self._closed:
+            self._closed = True
+            _write_err(self._format().lstrip("\r") + "\n")
+
+    def clear(self) -> None:
+        """Close the bar; nothing was drawn, so nothing is written."""
+        self._closed = True
+
+    def _render(self) -> None:
+        pass
+
+
+def bar(total: int, description: str = "", throttle_ms: int = 33) -> BarHandle:
+    """Create a progress bar on stderr.
 
     Args:
         total: Total number of units.
         description: Bar description.
+        throttle_ms: Minimum time between redraws in milliseconds.
+            Defaults to 33 (about 30 redraws per second).
 
     Returns:
         BarHandle for controlling the progress bar.
@@ -197,7 +597,10 @@ def bar(total: int, description: str = "") -> BarHandle:
         ...     b.add(1)
         >>> b.finish()
     """
-    return BarHandle(total, description)
+    # Bars draw on stderr, like tqdm, so piped output stays clean
+    if not is_tty(sys.stderr):
+        return _NullBar(total, description, throttle_ms)
+    return BarHandle(total, description, throttle_ms)
 
 
 class StageProgress:
@@ -214,6 +617,7 @@ class StageProgress:
         >>> with stages.next("Testing") as s:
         ...     s.success("All tests pass")
         >>> stages.skip("Deployment")
+        >>> stages.close()
     """
 
     def __init__(self, total: int) -> None:
@@ -224,6 +628,11 @@ class StageProgress:
         """
         self._total = total
         self._current = 0
+        # One spinner backend shared by every stage, restarted per stage
+        self._spinner = _make_spinner("")
+        # Stage number whose handle controls the spinner; handles of earlier
+        # stages only write their own final line
+        self._owner = 0
 
     @property
     def current(self) -> int:
@@ -249,7 +658,8 @@ class StageProgress:
             StageSpinnerHandle for controlling the stage spinner.
         """
         self._current += 1
-        return StageSpinnerHandle(self._current, self._total, msg)
+        self._owner = self._current
+        return StageSpinnerHandle(self._current, self._total, msg, stages=self)
 
     def skip(self, msg: str) -> None:
         """Skip the next stage.
@@ -258,8 +668,15 @@ class StageProgress:
             msg: Stage description.
         """
         self._current += 1
-        skipped = f"{Style.DIM}(skipped){Style.RESET_ALL}"
-        print(f"  {_SKIP_ICON} [{self._current}/{self._total}] {msg} {skipped}")
+        # A stage still animating keeps its line; the skip goes above it
+        self._spinner.write_line(
+            f"{_SKIP_LINE_PREFIX}[{self._current}/{self._total}] {msg}{_SKIP_LINE_SUFFIX}\n"
+        )
+
+    def close(self) -> None:
+        """Stop the shared stage spinner if a stage was left running."""
+        if self._spinner.running:
+            self._spinner.stop()
 
 
 class StageSpinnerHandle:
@@ -268,25 +685,32 @@ class StageSpinnerHandle:
     Similar to SpinnerHandle but includes stage numbering.
     """
 
-    def __init__(self, current: int, total: int, msg: str) -> None:
+    def __init__(
+        self,
+        current: int,
+        total: int,
+        msg: str,
+        stages: StageProgress | None = None,
+    ) -> None:
         """Create a stage spinner.
 
         Args:
             current: Current stage number.
             total: Total stages.
             msg: Stage message.
+            stages: Tracker whose shared spinner to use; a new spinner is
+                created if omitted.
         """
         self._current = current
         self._total = total
         self._msg = msg
-        self._prefix = f"[{current}/{total}]"
-        self._halo = Halo(
-            text=f"{self._prefix} {msg}",
-            spinner="dots",
-            color="cyan",
-            stream=sys.stdout,
-        )
-        self._halo.start()
+        # Stage number and its trailing space, shared by every line of the
+        # stage so each spinner frame carries it without a separate write
+        self._prefix = f"[{current}/{total}] "
+        text = self._prefix + msg
+        self._stages = stages
+        self._spinner = stages._spinner if stages is not None else _make_spinner(text)
+        self._spinner.start(text)
 
     def __enter__(self) -> StageSpinnerHandle:
         """Enter context manager."""
@@ -299,9 +723,19 @@ class StageSpinnerHandle:
         exc_tb: TracebackType | None,
     ) -> None:
         """Exit context manager."""
-        if self._halo.spinner_id is not None:
+        if self._owns_spinner() and self._spinner.running:
             self.clear()
 
+    def _owns_spinner(self) -> bool:
+        # A later stage takes over the shared spinner when it starts
+        return self._stages is None or self._stages._owner == self._current
+
+    def _finish(self, line: str) -> None:
+        if self._owns_spinner():
+            self._spinner.stop(line)
+        else:
+            self._spinner.write_line(line)
+
     def update_message(self, msg: str) -> None:
         """Update the stage message.
 
@@ -309,7 +743,8 @@ class StageSpinnerHandle:
             msg: New message.
         """
         self._msg = msg
-        self._halo.text = f"{self._prefix} {msg}"
+        if self._owns_spinner():
+            self._spinner.text = self._prefix + msg
 
     def success(self, msg: str) -> None:
         """Complete stage with success.
@@ -317,8 +752,7 @@ class StageSpinnerHandle:
         Args:
             msg: Success message.
         """
-        self._halo.stop()
-        print(f"\r{_SUCCESS_ICON} {self._prefix} {msg}")
+        self._finish(_SUCCESS_LINE + self._prefix + msg + "\n")
 
     def error(self, msg: str) -> None:
         """Complete stage with error.
@@ -326,8 +760,7 @@ class StageSpinnerHandle:
         Args:
             msg: Error message.
         """
-        self._halo.stop()
-        print(f"\r{_ERROR_ICON} {self._prefix} {msg}")
+        self._finish(_ERROR_LINE + self._prefix + msg + "\n")
 
     def warn(self, msg: str) -> None:
         """Complete stage with warning.
@@ -335,11 +768,9 @@ class StageSpinnerHandle:
         Args:
             msg: Warning message.
         """
-        self._halo.stop()
-        print(f"\r{_WARN_ICON} {self._prefix} {msg}")
+        self._finish(_WARN_LINE + self._prefix + msg + "\n")
 
     def clear(self) -> None:
         """Clear the spinner without a message."""
-        self._halo.stop()
-        full_msg = f"{self._prefix} {self._msg}"
-        print("\r" + " " * (len(full_msg) + 10) + "\r", end="")
+        if self._owns_spinner():
+            self._spinner.stop()
@@ -1,10 +1,21 @@
 """Tests for pintui.format module."""
 
+import sys
 from datetime import timedelta
 
 import pytest
 
-from pintui.format import human_duration, human_size, parse_size, pluralize, truncate_path
+from pintui.format import (
+    compile_fmt,
+    human_duration,
+    human_duration_s,
+    human_size,
+    human_size_array,
+    parse_size,
+    parse_size_many,
+    pluralize,
+    truncate_path,
+)
 
 
 class TestHumanSize:
@@ -28,6 +39,51 @@ class TestHumanSize:
 
     def test_terabytes(self) -> None:
         assert human_size(1024 * 1024 * 1024 * 1024) == "1.00 TB"
+        assert human_size(1024 * 1024 * 1024 * 1024 * 1024) == "1024.00 TB"
+
+    def test_unit_boundaries(self) -> None:
+        assert human_size(1024 * 1024 - 1) == "1024.0 KB"
+        assert human_size(1024 * 1024 * 1024 - 1) == "1024.0 MB"
+
+    def test_float_input(self) -> None:
+        assert human_size(1536.0) == "1.5 KB"
+        assert human_size(1023.5) == "1023.5 B"
+        assert human_size(1024.5) == "1.0 KB"
+        assert human_size(float("inf")) == "inf TB"
+        assert human_size(float("nan")) == "nan B"
+
+    def test_numpy_integer_input(self) -> None:
+        np = pytest.importorskip("numpy")
+        assert human_size(np.int64(2048)) == "2.0 KB"
+
+
+class TestHumanSizeArray:
+    """Tests for human_size_array function."""
+
+    def test_matches_human_size(self) -> None:
+        np = pytest.importorskip("numpy")
+        sizes = [0, 1023, 1024, 1536, 1024**2 - 1, 1024**3, 1024**4, 1024**5]
+        expected = [human_size(s) for s in sizes]
+        assert human_size_array(sizes) == expected
+        assert human_size_array(np.array(sizes, dtype=np.int64)) == expected
+
+    def test_generator(self) -> None:
+        pytest.importorskip("numpy")
+        assert human_size_array(s for s in (512, 2048)) == ["512 B", "2.0 KB"]
+
+    def test_out_of_range(self) -> None:
+        np = pytest.importorskip("numpy")
+        with pytest.raises(ValueError):
+            human_size_array(np.array([2**63], dtype=np.uint64))
+        with pytest.raises(ValueError):
+            human_size_array([2**63])
+        with pytest.raises(ValueError):
+            human_size_array([-1, 2**64])
+        assert human_size_array(np.array([2**40], dtype=np.uint64)) == ["1.00 TB"]
+
+    def test_empty(self) -> None:
+        pytest.importorskip("numpy")
+        assert human_size_array([]) == []
 
 
 class TestParseSize:
@@ -54,6 +110,11 @@ class TestParseSize:
 
     def test_whitespace(self) -> None:
         assert parse_size("  100MB  ") == 100 * 1024 * 1024
+        assert parse_size("100 MB") == 100 * 1024 * 1024
+
+    def test_fractional(self) -> None:
+        assert parse_size("1.5KB") == 1536
+        assert parse_size("0.5GB") == 512 * 1024 * 1024
 
     def test_invalid_empty(self) -> None:
         with pytest.raises(ValueError):
@@ -67,6 +128,73 @@ class TestParseSize:
         with pytest.raises(ValueError):
             parse_size("abc")
 
+    def test_invalid_number(self) -> None:
+        for size_str in ("1.", ".5", "-1", "1e3", "1_000", "inf", "nan"):
+            with pytest.raises(ValueError):
+                parse_size(size_str)
+
+    def test_invalid_unit(self) -> None:
+        for size_str in ("1K", "1BB", "1PB", "1 K B"):
+            with pytest.raises(ValueError):
+                parse_size(size_str)
+
+
+class TestParseSizeMany:
+    """Tests for parse_size_many function."""
+
+    LINES = ["100", "100B", "1kb", "1.5 KB", "  100MB  ", "0.5GB", "1TB", "3.14159MB"]
+
+    def _check(self) -> None:
+        data = "\n".join(self.LINES).encode() + b"\n\n  \r\n"
+        result = parse_size_many(data)
+        assert result.tolist() == [parse_size(line) for line in self.LINES]
+
+    def test_matches_parse_size(self) -> None:
+        pytest.importorskip("numpy")
+        self._check()
+
+    def test_pure_python_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip("numpy")
+        monkeypatch.setitem(sys.modules, "pintui._fast_format", None)
+        self._check()
+
+    def test_long_and_non_ascii_numbers(self) -> None:
+        pytest.importorskip("numpy")
+        lines = ["12345678901234567.5", "١٢KB"]
+        data = "\n".join(lines).encode()
+        assert parse_size_many(data).tolist() == [parse_size(line) for line in lines]
+
+    def test_generator(self) -> None:
+        pytest.importorskip("numpy")
+        assert human_size_array(s for s in (512, 2048)) == ["512 B", "2.0 KB"]
+
+    def test_out_of_range(self) -> None:
+        np = pytest.importorskip("numpy")
+        with pytest.raises(ValueError):
+            human_size_array(np.array([2**63], dtype=np.uint64))
+        with pytest.raises(ValueError):
+            human_size_array([2**63])
+        with pytest.raises(ValueError):
+            human_size_array([-1, 2**64])
+        assert human_size_array(np.array([2**40], dtype=np.uint64)) == ["1.00 TB"]
+
+    def test_empty(self) -> None:
+        pytest.importorskip("numpy")
+        assert parse_size_many(b"").tolist() == []
+
+    def test_invalid_line(self) -> None:
+        pytest.importorskip("numpy")
+        with pytest.raises(ValueError):
+            parse_size_many(b"1KB\n1K\n")
+
+    def test_too_large_for_int64(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip("numpy")
+        with pytest.raises(ValueError):
+            parse_size_many(b"1KB\n9999999999TB\n")
+        monkeypatch.setitem(sys.modules, "pintui._fast_format", None)
+        with pytest.raises(ValueError):
+            parse_size_many(b"1KB\n9999999999TB\n")
+
 
 class TestTruncatePath:
     """Tests for truncate_path function."""
@@ -82,6 +210,12 @@ class TestTruncatePath:
         assert result.startswith("...")
         assert len(result) <= 15
 
+    def test_truncate_at_separator(self) -> None:
+        assert truncate_path("/very/long/path/to/file.txt", 15) == ".../to/file.txt"
+        assert truncate_path("/very/long/path/to/file.txt", 16) == ".../to/file.txt"
+        assert truncate_path("abcdefghijklmnop", 10) == "...jklmnop"
+        assert truncate_path("/aaaaaaaaaa/bbbbbbbbbb/", 8) == "...bbbb/"
+
     def test_very_short_max(self) -> None:
         assert truncate_path("test", 3) == "..."
         assert truncate_path("test", 2) == "..."
@@ -130,3 +264,37 @@ class TestHumanDuration:
     def test_timedelta(self) -> None:
         assert human_duration(timedelta(seconds=90)) == "1m 30s"
         assert human_duration(timedelta(hours=1, minutes=30)) == "1h 30m"
+
+    def test_seconds_variant(self) -> None:
+        assert human_duration_s(0.5) == "500ms"
+        assert human_duration_s(5.5) == "5.5s"
+        assert human_duration_s(90) == "1m 30s"
+        assert human_duration_s(3661) == "1h 1m"
+        assert human_duration_s(-1) == "0ms"
+
+
+class TestCompileFmt:
+    """Tests for compile_fmt function."""
+
+    def test_bare_fields(self) -> None:
+        render = compile_fmt("Processing {} files in {}")
+        assert render(10, "src") == "Processing 10 files in src"
+        assert render(1.5, "x") == "Processing 1.5 files in x"
+
+    def test_percent_literal(self) -> None:
+        assert compile_fmt("{}% done")(50) == "50% done"
+
+    def test_matches_str_format(self) -> None:
+        for fmt, args in [
+            ("{:>5}|", (42,)),
+            ("{0} {0}", ("a",)),
+            ("{{}} {}", ("x",)),
+            ("{} {}", ("extra", "args", "ignored")),
+            ("{}", (True,)),
+            ("no fields", ()),
+        ]:
+            assert compile_fmt(fmt)(*args) == fmt.format(*args)
+
+    def test_missing_args(self) -> None:
+        with pytest.raises(IndexError):
+            compile_fmt("{} {}")("only one")
@@ -61,6 +61,12 @@ class TestLayoutDoNotPanic:
         assert "          Five levels" in captured.out
         assert "    Formatted message" in captured.out
 
+    def test_indent_deep_and_negative(self, capsys: pytest.CaptureFixture[str]) -> None:
+        layout.indent(40, "Deep")
+        layout.indent(-1, "Negative")
+        captured = capsys.readouterr()
+        assert captured.out == " " * 80 + "Deep\nNegative\n"
+
     def test_empty_values(self) -> None:
         # Should not raise
         layout.header("")
@@ -76,3 +82,22 @@ class TestLayoutDoNotPanic:
         assert "日本語ヘッダー" in captured.out
         assert "セクション" in captured.out
         assert "キー: 値" in captured.out
+
+
+class TestBuffered:
+    """Tests for batched layout output."""
+
+    def test_flushes_on_exit(self, capsys: pytest.CaptureFixture[str]) -> None:
+        with layout.buffered():
+            layout.kv("key", "value")
+            layout.step(1, 2, "First")
+            assert capsys.readouterr().out == ""
+        captured = capsys.readouterr()
+        assert captured.out == "  key: value\n[1/2] First\n"
+
+    def test_flushes_on_error(self, capsys: pytest.CaptureFixture[str]) -> None:
+        with pytest.raises(RuntimeError), layout.buffered():
+            layout.kv("key", "value")
+            raise RuntimeError("boom")
+        captured = capsys.readouterr()
+        assert "key: value" in captured.out
@@ -1,8 +1,10 @@
 """Tests for pintui.messages module."""
 
+import io
+
 import pytest
 
-from pintui import messages
+from pintui import _ansi, messages
 
 
 class TestMessagesDoNotPanic:
@@ -43,6 +45,25 @@ class TestMessagesDoNotPanic:
         assert "test message" in captured.out
         assert "formatted message" in captured.out
 
+    def test_info_template(self, capsys: pytest.CaptureFixture[str]) -> None:
+        processing = messages.info_template("Processing {}")
+        processing("a.txt")
+        processing("b.txt")
+        captured = capsys.readouterr()
+        assert "Processing a.txt" in captured.out
+        assert "Processing b.txt" in captured.out
+
+    def test_other_templates(self, capsys: pytest.CaptureFixture[str]) -> None:
+        messages.success_template("Deployed {} in {}")("api", "1.2s")
+        messages.warn_template("{}% quota used")(90)
+        messages.error_template("Exit code {}")(2)
+        messages.dim_template("debug: {}")("state")
+        captured = capsys.readouterr()
+        assert "Deployed api in 1.2s" in captured.out
+        assert "90% quota used" in captured.out
+        assert "Exit code 2" in captured.out
+        assert "debug: state" in captured.out
+
     def test_empty_messages(self) -> None:
         # Should not raise
         messages.info("")
@@ -57,3 +78,82 @@ class TestMessagesDoNotPanic:
         captured = capsys.readouterr()
         assert "Hello 世界 🌍" in captured.out
         assert "Completed ✨" in captured.out
+
+    @pytest.mark.skipif(_ansi.COLOR, reason="color forced on")
+    def test_plain_icons_without_tty(self, capsys: pytest.CaptureFixture[str]) -> None:
+        messages.info("a")
+        messages.success("b")
+        messages.warn("c")
+        messages.error("d")
+        captured = capsys.readouterr()
+        assert captured.out == "i a\n+ b\n! c\nx d\n"
+
+
+class _FakeTTY(io.TextIOWrapper):
+    """Text stream over an in-memory buffer that reports itself as a TTY."""
+
+    def __init__(self, encoding: str = "utf-8") -> None:
+        super().__init__(io.BytesIO(), encoding=encoding)
+
+    def isatty(self) -> bool:
+        return True
+
+
+class TestMessagesTTY:
+    """Verify the raw byte-write path used for terminals."""
+
+    def test_tty_output(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        fake = _FakeTTY()
+        monkeypatch.setattr(messages, "_RAW_WRITES", True)
+        monkeypatch.setattr("sys.stdout", fake)
+        fake.write("before\n")
+        messages.info("Hello 世界")
+        messages.dim("details")
+        out = fake.buffer.getvalue().decode()
+        assert out.startswith("before\n")
+        assert "Hello 世界\n" in out
+        assert "details" in out
+        assert out.count("\n") == 3
+
+    def test_stream_encoding(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        fake = _FakeTTY("latin-1")
+        monkeypatch.setattr(messages, "_RAW_WRITES", True)
+        monkeypatch.setattr("sys.stdout", fake)
+        messages.info("café")
+        assert fake.buffer.getvalue().endswith("café\n".encode("latin-1"))
+
+
+class TestColorDetection:
+    """Verify the environment variables that turn color on or off."""
+
+    @pytest.mark.parametrize(
+        ("env", "expected"),
+        [
+            ({"NO_COLOR": "1"}, False),
+            ({"NO_COLOR": ""}, True),
+            ({"CLICOLOR": "0"}, False),
+            ({"CLICOLOR_FORCE": "1", "NO_COLOR": "1"}, True),
+            ({"CLICOLOR_FORCE": "0"}, True),
+        ],
+    )
+    def test_env(
+        self, monkeypatch: pytest.MonkeyPatch, env: dict[str, str], expected: bool
+    ) -> None:
+        for name in ("NO_COLOR", "CLICOLOR", "CLICOLOR_FORCE"):
+            monkeypatch.delenv(name, raising=False)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        monkeypatch.setattr(_ansi, "FORCE_COLOR", None)
+        monkeypatch.setattr("sys.stdout", _FakeTTY())
+        assert _ansi._color_enabled() is expected
+
+    def test_force_color_wins(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("NO_COLOR", "1")
+        monkeypatch.setattr(_ansi, "FORCE_COLOR", "1")
+        assert _ansi._color_enabled()
+
+    def test_missing_stdout(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(_ansi, "FORCE_COLOR", None)
+        monkeypatch.setattr("sys.stdout", None)
+        assert not _ansi._color_enabled()
+        messages.info("dropped")
@@ -1,10 +1,36 @@
 """Tests for pintui.progress module."""
 
+import contextlib
+import io
+import os
+import subprocess
+import sys
+
 import pytest
 
 from pintui import progress
 
 
+def _final_line(capsys: pytest.CaptureFixture[str]) -> str:
+    """Return captured output, checking it is a single terminated line."""
+    out = capsys.readouterr().out
+    assert out.count("\n") == 1
+    assert out.endswith("\n")
+    return out
+
+
+def _always_tty(stream: object) -> bool:
+    """Stand-in for progress.is_tty that treats every stream as a terminal."""
+    return True
+
+
+def _record_writes(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Capture each progress frame write as one joined string."""
+    writes: list[str] = []
+    monkeypatch.setattr(progress, "_write", lambda *parts: writes.append("".join(parts)))
+    return writes
+
+
 class TestSpinner:
     """Tests for spinner functionality."""
 
@@ -15,20 +41,17 @@ class TestSpinner:
     def test_success(self, capsys: pytest.CaptureFixture[str]) -> None:
         s = progress.spinner("Test")
         s.success("Done")
-        captured = capsys.readouterr()
-        assert "Done" in captured.out
+        assert "Done" in _final_line(capsys)
 
     def test_error(self, capsys: pytest.CaptureFixture[str]) -> None:
         s = progress.spinner("Test")
         s.error("Failed")
-        captured = capsys.readouterr()
-        assert "Failed" in captured.out
+        assert "Failed" in _final_line(capsys)
 
     def test_warn(self, capsys: pytest.CaptureFixture[str]) -> None:
         s = progress.spinner("Test")
         s.warn("Warning")
-        captured = capsys.readouterr()
-        assert "Warning" in captured.out
+        assert "Warning" in _final_line(capsys)
 
     def test_update_message(self) -> None:
         s = progress.spinner("Initial")
@@ -39,6 +62,126 @@ class TestSpinner:
         with progress.spinner("Test") as s:
             s.success("Done")
 
+    def test_non_tty_output(self, capsys: pytest.CaptureFixture[str]) -> None:
+        s = progress.spinner("Working")
+        s.update_message("Still working")
+        s.success("Done")
+        s = progress.spinner("Cleanup")
+        s.clear()
+        assert capsys.readouterr().out == progress._SUCCESS_ICON + " Done\n"
+
+    def test_animated_on_tty(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(progress, "is_tty", _always_tty)
+        with progress.spinner("Test") as s:
+            s.update_message("Updated")
+        stages = progress.StageProgress(2)
+        s = stages.next("Stage 1")
+        s.success("Done")
+        s = stages.next("Stage 2")
+        assert s._spinner is stages._spinner
+        stages.close()
+        assert not stages._spinner.running
+
+    def test_frames_follow_message(self) -> None:
+        spin = progress._Spinner("Test")
+        frames = [spin.next_frame() for _ in range(len(progress._SPINNER_FRAMES) + 1)]
+        assert frames[0] == frames[-1]
+        assert all(frame.endswith(" Test") for frame in frames)
+        spin.text = "Updated"
+        assert spin.next_frame().endswith(" Updated")
+        frames = spin._frames
+        spin.start("Updated")
+        spin.stop()
+        assert spin._frames is frames
+
+    def test_shorter_frame_padded(self) -> None:
+        service = progress._SpinnerService()
+        service._paint(progress._Spinner("Long message"))
+        assert service._paint(progress._Spinner("Short")).endswith(" Short" + " " * 7)
+        assert service._paint(progress._Spinner("Short")).endswith(" Short")
+
+    def test_skip_while_stage_running(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(progress, "is_tty", _always_tty)
+        writes = _record_writes(monkeypatch)
+        stages = progress.StageProgress(2)
+        stages.next("Build")
+        stages.skip("Deploy")
+        stages.close()
+        [skip_write] = [text for text in writes if "Deploy" in text]
+        assert "[2/2] Deploy (skipped)\n" in skip_write
+        assert skip_write.endswith(" [1/2] Build")
+
+    def test_no_teardown_when_never_drawn(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(progress, "is_tty", _always_tty)
+        writes = _record_writes(monkeypatch)
+        progress.spinner("Quick").clear()
+        progress.spinner("Quick").success("Done")
+        assert writes == [progress._SUCCESS_LINE + "Done\n"]
+
+    def test_final_line_after_stop(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(progress, "is_tty", _always_tty)
+        writes = _record_writes(monkeypatch)
+        s = progress.spinner("Test")
+        s.clear()
+        s.success("Done")
+        assert writes[-1] == progress._SUCCESS_LINE + "Done\n"
+
+    def test_final_line_in_one_write(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(progress, "is_tty", _always_tty)
+        # No background ticks during the test; paint the first frame directly
+        monkeypatch.setattr(progress, "_SPINNER_INTERVAL", 60.0)
+        writes = _record_writes(monkeypatch)
+        s = progress.spinner("Test")
+        assert progress._SERVICE.write_above("")
+        del writes[:]
+        s.success("Done")
+        assert len(writes) == 1
+        assert writes[0].startswith("\r" + progress._CLEAR_LINE)
+        assert writes[0].endswith(" Done\n")
+
+    def test_thread_exits_after_last_spinner(self) -> None:
+        spin = progress._Spinner("Test").start()
+        thread = progress._SERVICE._thread
+        assert thread is not None
+        spin.stop()
+        thread.join(timeout=1)
+        assert not thread.is_alive()
+
+    def test_tty_checked_per_spinner(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        tty = io.StringIO()
+        monkeypatch.setattr(tty, "isatty", lambda: True)
+        monkeypatch.setattr(sys, "stdout", tty)
+        assert isinstance(progress._make_spinner("Test"), progress._Spinner)
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert isinstance(progress._make_spinner("Test"), progress._NullSpinner)
+        assert isinstance(progress._make_spinner("Test"), progress._Spinner)
+
+    def test_raw_fd_writes(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        read_fd, write_fd = os.pipe()
+        monkeypatch.setattr(progress, "_FD", write_fd)
+        monkeypatch.setattr(progress, "_STDOUT", sys.stdout)
+        try:
+            progress._write("\u2713 frame")
+            assert os.read(read_fd, 100) == "\u2713 frame".encode()
+            progress._write("\r", "", "one ", "frame")
+            assert os.read(read_fd, 100) == b"\rone frame"
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def test_raw_fd_stream_encoding(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        out = io.TextIOWrapper(io.BytesIO(), encoding="latin-1", errors="replace")
+        read_fd, write_fd = os.pipe()
+        monkeypatch.setattr(sys, "stdout", out)
+        monkeypatch.setattr(progress, "_FD", write_fd)
+        monkeypatch.setattr(progress, "_STDOUT", out)
+        try:
+            progress._write("café ", "\u2713")
+            assert os.read(read_fd, 100) == b"caf\xe9 ?"
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
 
 class TestBar:
     """Tests for progress bar functionality."""
@@ -59,6 +202,119 @@ class TestBar:
         b.add(25)
         b.clear()
 
+    def test_non_tty_output(self, capsys: pytest.CaptureFixture[str]) -> None:
+        b = progress.bar(10, "Test")
+        b.add(5)
+        assert capsys.readouterr().err == ""
+        b.set(10)
+        b.finish()
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        out = captured.err
+        assert out.startswith("Test [")
+        assert out.endswith("100% (10/10)\n")
+        assert out.count("\n") == 1
+
+    def test_throttled_redraws(
+        self, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(progress, "is_tty", _always_tty)
+        b = progress.bar(1000, "Test", throttle_ms=60_000)
+        for _ in range(999):
+            b.add(1)
+        frames = capsys.readouterr().err.count("\r")
+        assert frames == 1  # only the initial draw
+        b.add(1)
+        b.finish()
+        captured = capsys.readouterr()
+        assert "100% (1000/1000)" in captured.err
+        assert captured.err.endswith("\n")
+
+    def test_throttled_past_total(
+        self, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(progress, "is_tty", _always_tty)
+        b = progress.bar(10, "Test", throttle_ms=60_000)
+        b.set(10)
+        for _ in range(1000):
+            b.add(1)
+        assert capsys.readouterr().err.count("\r") == 2  # initial draw and reaching 10
+        b.finish()
+        assert "(1010/10)" in capsys.readouterr().err
+
+    def test_shorter_frame_padded(
+        self, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(progress, "is_tty", _always_tty)
+        b = progress.bar(1000, "Test", throttle_ms=0)
+        b.set(100)
+        capsys.readouterr()
+        b.set(5)
+        assert capsys.readouterr().err.endswith("(5/1000)  ")
+        b.finish()
+
+    def test_add_checks_in_steps(
+        self, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(progress, "is_tty", _always_tty)
+        b = progress.bar(1600, "Test", throttle_ms=0)
+        for _ in range(9):
+            b.add(1)
+        assert capsys.readouterr().err.count("\r") == 1  # only the initial draw
+        b.add(1)
+        assert "(10/1600)" in capsys.readouterr().err
+        b.add(1590)
+        assert "(1600/1600)" in capsys.readouterr().err
+        b.finish()
+
+    def test_clear_twice(self, capsys: pytest.CaptureFixture[str]) -> None:
+        b = progress.BarHandle(10, "Test")
+        b.clear()
+        capsys.readouterr()
+        b.clear()
+        assert capsys.readouterr().err == ""
+
+    @pytest.mark.parametrize("bar_type", [progress.BarHandle, progress._NullBar])
+    def test_closed_after_finish(
+        self, capsys: pytest.CaptureFixture[str], bar_type: type[progress.BarHandle]
+    ) -> None:
+        b = bar_type(10, "Test")
+        b.add(10)
+        b.finish()
+        capsys.readouterr()
+        b.finish()
+        b.clear()
+        b.add(1)
+        assert capsys.readouterr().err == ""
+
+    def test_partial_fill(self) -> None:
+        b = progress.BarHandle(4, "", throttle_ms=0)
+        b.set(1)
+        assert "[" + "━" * 10 + "─" * 30 + "]  25% (1/4)" in b._format()
+        b.set(-1)
+        assert "[" + "─" * 40 + "]   0%" in b._format()
+        b.set(9)
+        assert "[" + "━" * 40 + "] 100%" in b._format()
+        b = progress.BarHandle(100, "", throttle_ms=0)
+        for value in (29, 57, 58):
+            b.set(value)
+            assert f"] {value:3d}% ({value}/100)" in b._format()
+        b = progress.BarHandle(0, "", throttle_ms=0)
+        assert "[" + "━" * 40 + "] 100% (0/0)" in b._format()
+        b.clear()
+
+    def test_unchanged_frame_not_redrawn(
+        self, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(progress, "is_tty", _always_tty)
+        b = progress.bar(10, "Test", throttle_ms=0)
+        b.add(0)
+        b.set(0)
+        assert capsys.readouterr().err.count("\r") == 1
+        b.add(1)
+        assert "(1/10)" in capsys.readouterr().err
+        b.finish()
+
 
 class TestStageProgress:
     """Tests for StageProgress functionality."""
@@ -81,6 +337,11 @@ class TestStageProgress:
         stages.skip("Stage 3")
         assert stages.current == 3
         assert stages.is_complete()
+        stages.close()
+
+        captured = capsys.readouterr()
+        assert "[3/3] Stage 3" in captured.out
+        assert "(skipped)" in captured.out
 
     def test_empty_stage_progress(self) -> None:
         stages = progress.StageProgress(0)
@@ -90,10 +351,49 @@ class TestStageProgress:
         stages = progress.StageProgress(1)
         s = stages.next("Working")
         s.success("Complete")
-        captured = capsys.readouterr()
-        assert "Complete" in captured.out
+        assert "Complete" in _final_line(capsys)
+
+    def test_stage_frame_includes_header(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(progress, "is_tty", _always_tty)
+        stages = progress.StageProgress(2)
+        s = stages.next("Building")
+        s.update_message("Linking")
+        frame = stages._spinner.next_frame()
+        stages.close()
+        assert frame.startswith("\r")
+        assert frame.endswith(" [1/2] Linking")
+
+    def test_earlier_stage_leaves_spinner(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(progress, "is_tty", _always_tty)
+        writes = _record_writes(monkeypatch)
+        stages = progress.StageProgress(2)
+        with stages.next("A") as a:
+            b = stages.next("B")
+        assert stages._spinner.running
+        a.success("A ok")
+        assert stages._spinner.running
+        assert stages._spinner.text == "[2/2] B"
+        b.success("B ok")
+        assert not stages._spinner.running
+        output = "".join(writes)
+        assert "[1/2] A ok\n" in output
+        assert output.endswith("[2/2] B ok\n")
 
     def test_stage_spinner_context_manager(self) -> None:
         stages = progress.StageProgress(1)
         with stages.next("Working") as s:
             s.success("Done")
+
+
+class TestLazyImport:
+    """Tests for loading pintui.progress on first use."""
+
+    def test_not_imported_with_package(self) -> None:
+        code = "import sys, pintui; assert 'pintui.progress' not in sys.modules"
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_attribute_access(self) -> None:
+        import pintui
+
+        assert pintui.progress is progress
+        assert "progress" in dir(pintui)